@@ -1,13 +1,24 @@
 import streamlit as st
-import pandas as pd
-import math
-import numpy as np
+
+import planner
 
 # --------------------------------------------------------
 #                PAGE SETUP
 # --------------------------------------------------------
 st.set_page_config(page_title="AI Study Planner", layout="centered")
-st.image("logo.png", width=120)
+
+@st.cache_resource
+def _load_logo():
+    # Read once per process instead of on every rerun
+    try:
+        with open("logo.png", "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+logo = _load_logo()
+if logo:
+    st.image(logo, width=120)
 st.title("📘 AI Study Planner – Smart Exam Preparation")
 
 st.write(
@@ -16,17 +27,16 @@ st.write(
 )
 
 # --------------------------------------------------------
-# Convert hours to readable format
+# Planner pipeline (cached across reruns)
 # --------------------------------------------------------
-def format_time(hours):
-    h = int(hours)
-    m = int((hours - h) * 60)
-    if h == 0:
-        return f"{m} min"
-    elif m == 0:
-        return f"{h} hr"
-    else:
-        return f"{h} hr {m} min"
+@st.cache_data
+def build_tasks(subjects_input, days, daily_hours):
+    tasks, hard_count = planner.parse_tasks(subjects_input)
+    return planner.allocate_hours(tasks, days, daily_hours), hard_count
+
+build_plan = st.cache_data(planner.build_plan)
+build_tables = st.cache_data(planner.build_tables)
+build_download = st.cache_data(planner.build_download)
 
 # --------------------------------------------------------
 #                USER INPUT SECTION
@@ -51,53 +61,33 @@ generate = st.button("✨ Generate Study Plan")
 # --------------------------------------------------------
 #                PROCESSING
 # --------------------------------------------------------
-if generate:
-
-    lines = subjects_input.strip().split("\n")
-    tasks = []
-
-    diff_weight = {"easy": 1, "medium": 2, "hard": 3}
-
-    # Parse input
-    for line in lines:
-        if ":" in line:
-            subject, topics = line.split(":")
-            topics_list = topics.split(",")
-
-            for t in topics_list:
-                t = t.strip()
-                if "(" in t:
-                    chapter = t.split("(")[0].strip()
-                    diff = t.split("(")[1].replace(")", "").strip().lower()
-                    weight = diff_weight.get(diff, 1)
-                    tasks.append([subject.strip(), chapter, diff, weight])
+plan_key = hash((subjects_input, days, daily_hours))
+
+# Reruns from other widgets (e.g. the download button) reuse the stored
+# plan while the inputs are unchanged
+if generate and st.session_state.get("plan_key") != plan_key:
+
+    tasks, hard_count = build_tasks(subjects_input, days, daily_hours)
+    if not tasks:
+        st.warning("No valid topics detected. Use the format `Subject: Topic (difficulty)`.")
+        st.stop()
+
+    st.session_state["plan_key"] = plan_key
+    st.session_state["plan_cache"] = (
+        hard_count,
+        build_plan(tuple(tasks), daily_hours),
+        *build_tables(tuple(tasks)),
+    )
 
-    total_weight = sum([t[3] for t in tasks])
-    total_hours = days * daily_hours
+if st.session_state.get("plan_key") == plan_key:
 
-    # Allocate hours proportionally
-    for t in tasks:
-        allocated = round((t[3] / total_weight) * total_hours, 2)
-        t.append(allocated)
+    hard_count, plan, df_topics, df_summary = st.session_state["plan_cache"]
 
     # --------------------------------------------------------
     #          TOPIC-WISE TIME ALLOCATION TABLE
     # --------------------------------------------------------
-    st.header("📘 Topic-wise Time Allocation")
-
-    topic_data = []
-    for t in tasks:
-        subject, chapter, diff, weight, hrs = t
-        topic_data.append([
-            subject,
-            chapter,
-            diff.capitalize(),
-            format_time(hrs)
-        ])
-
-    df_topics = pd.DataFrame(topic_data, columns=["Subject", "Topic", "Difficulty", "Allocated Time"])
-    df_topics.index = df_topics.index + 1
-    st.dataframe(df_topics, use_container_width=True)
+    with st.expander("📘 Topic-wise Time Allocation", expanded=False):
+        st.dataframe(df_topics, use_container_width=True)
 
 
     # --------------------------------------------------------
@@ -105,24 +95,6 @@ if generate:
     # --------------------------------------------------------
     st.header("📊 Subject-wise Study Hour Breakdown")
 
-    subject_summary = {}
-    for t in tasks:
-        sub, chap, diff, weight, hrs = t
-        subject_summary[sub] = subject_summary.get(sub, 0) + hrs
-
-    df_summary = pd.DataFrame(
-        {
-            "Subject": list(subject_summary.keys()),
-            "Allocated Hours": list(subject_summary.values()),
-        }
-    )
-
-    df_summary["Readable Time"] = df_summary["Allocated Hours"].apply(format_time)
-    df_summary["% Weight"] = (
-        df_summary["Allocated Hours"] / df_summary["Allocated Hours"].sum() * 100
-    ).round(2)
-
-    df_summary.index = df_summary.index + 1
     st.dataframe(df_summary, use_container_width=True)
 
 
@@ -136,59 +108,31 @@ if generate:
     max_sub = df_summary.loc[df_summary["Allocated Hours"].idxmax(), "Subject"]
     insights.append(f"• Focus more on **{max_sub}**, it has the highest study load.")
 
-    hard_topics = [t for t in tasks if t[2] == "hard"]
-    if len(hard_topics) >= 3:
-        insights.append(f"• You have **{len(hard_topics)} hard topics**. Start them early.")
+    if hard_count >= 3:
+        insights.append(f"• You have **{hard_count} hard topics**. Start them early.")
 
     if daily_hours < 3:
         insights.append("• Daily hours are quite low. Try increasing for better results.")
 
-    for i in insights:
-        st.write(i)
+    st.markdown("\n\n".join(insights))
 
 
     # --------------------------------------------------------
     #          DAY-BY-DAY PLAN
     # --------------------------------------------------------
-    st.header("📅 Detailed Day-by-Day Study Plan")
-
-    plan = {}
-    day = 1
-    hours_left = daily_hours
-
-    for task in tasks:
-        sub, chap, diff, w, hrs = task
-        remaining = hrs
-
-        while remaining > 0:
-            if day not in plan:
-                plan[day] = []
-
-            if hours_left == 0:
-                day += 1
-                hours_left = daily_hours
-                plan[day] = []
-
-            allocate = min(remaining, hours_left)
-            plan[day].append(f"{sub} – {chap} ({diff}) → {format_time(allocate)}")
-            hours_left -= allocate
-            remaining -= allocate
-
     # Display plan
-    for d in plan:
-        st.subheader(f"Day {d}")
-        for item in plan[d]:
-            st.write("• " + item)
+    with st.expander("📅 Detailed Day-by-Day Study Plan", expanded=False):
+        lines = []
+        for d, items in enumerate(plan, 1):
+            if not items:
+                continue
+            lines.append(f"### Day {d}")
+            lines.extend("- " + item for item in items)
+        st.markdown("\n".join(lines))
 
 
     # --------------------------------------------------------
     #          DOWNLOAD BUTTON
     # --------------------------------------------------------
-    output_text = "AI Study Plan\n\n"
-    for d in plan:
-        output_text += f"\nDay {d}\n"
-        for item in plan[d]:
-            output_text += "- " + item + "\n"
-
-    st.download_button("📥 Download Study Plan", output_text)
+    st.download_button("📥 Download Study Plan", build_download(plan), mime="text/plain")
 
@@ -0,0 +1,163 @@
+import io
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Streamlit re-executes app.py on every rerun, but this module is imported
+# once per process, so the pattern and caches below survive across reruns.
+
+# " Topic ( difficulty ), ..." -> [("Topic", "difficulty"), ...], whitespace
+# trimmed; entries without a "(difficulty)" are skipped
+TOPIC_RE = re.compile(r"\s*([^,(]+?)\s*\(\s*([^),]*?)\s*\)")
+DIFF_WEIGHT = {"easy": 1, "medium": 2, "hard": 3}
+
+# --------------------------------------------------------
+# Convert hours to readable format
+# --------------------------------------------------------
+@lru_cache(maxsize=256)
+def _format_minutes(total):
+    h, m = divmod(total, 60)
+    return f"{h} hr {m} min" if h and m else f"{h} hr" if h else f"{m} min"
+
+def format_time(hours):
+    # Key the cache on whole minutes so float noise still hits
+    return _format_minutes(round(hours * 60))
+
+def format_times(hours):
+    # Same as format_time, converting a whole column to minutes at once
+    minutes = np.rint(np.asarray(hours) * 60).astype(np.int64)
+    return [_format_minutes(m) for m in minutes.tolist()]
+
+# --------------------------------------------------------
+# Parse "Subject: Topic (difficulty), ..." lines
+# --------------------------------------------------------
+def parse_tasks(text):
+    tasks = []
+    hard_count = 0
+
+    for line in text.strip().split("\n"):
+        if ":" in line:
+            subject, topics = line.split(":", 1)
+            subject = subject.strip()
+
+            for chapter, diff in TOPIC_RE.findall(topics):
+                diff = diff.lower()
+                weight = DIFF_WEIGHT.get(diff, 1)
+                tasks.append((subject, chapter, diff, weight))
+                if diff == "hard":
+                    hard_count += 1
+
+    return tasks, hard_count
+
+# --------------------------------------------------------
+# Allocate hours proportionally to difficulty weight
+# --------------------------------------------------------
+def allocate_hours(tasks, days, daily_hours):
+    if not tasks:
+        return []
+
+    weights = np.fromiter((t[3] for t in tasks), dtype=np.float64, count=len(tasks))
+    total_minutes = int(days * daily_hours * 60)
+
+    # Largest-remainder split on whole minutes, so the topics add up
+    # to exactly the time available
+    quotas = weights * (total_minutes / weights.sum())
+    minutes = np.floor(quotas).astype(np.int64)
+    shortfall = total_minutes - int(minutes.sum())
+    order = np.argsort(minutes - quotas, kind="stable")
+    minutes[order[:shortfall]] += 1
+
+    return [t + (m / 60,) for t, m in zip(tasks, minutes.tolist())]
+
+# --------------------------------------------------------
+# Topic-wise and subject-wise tables
+# --------------------------------------------------------
+def build_tables(tasks):
+    # Build both frames from whole columns rather than row lists
+    subjects, topics, diffs, _, hours = zip(*tasks)
+    hours = np.asarray(hours)
+
+    df_topics = pd.DataFrame(
+        {
+            "Subject": subjects,
+            "Topic": topics,
+            "Difficulty": [d.capitalize() for d in diffs],
+            "Allocated Time": format_times(hours),
+        },
+        index=np.arange(1, len(hours) + 1),
+    )
+
+    totals = pd.Series(hours).groupby(list(subjects), sort=False).sum().round(2)
+    allocated = totals.to_numpy()
+
+    df_summary = pd.DataFrame(
+        {
+            "Subject": totals.index,
+            "Allocated Hours": allocated,
+            "Readable Time": format_times(allocated),
+            "% Weight": np.round(allocated / allocated.sum() * 100, 2),
+        },
+        index=np.arange(1, len(allocated) + 1),
+    )
+
+    return df_topics, df_summary
+
+# --------------------------------------------------------
+# Split topics into day-by-day slices
+# --------------------------------------------------------
+def build_plan(tasks, daily_hours):
+    # plan[i] holds the slices for day i + 1
+    plan = [[]]
+    day_minutes = int(daily_hours * 60)
+    minutes_left = day_minutes
+
+    # Pack in whole minutes so day boundaries compare exactly
+    for task in tasks:
+        sub, chap, diff, w, hrs = task
+        prefix = f"{sub} – {chap} ({diff}) → "
+        remaining = round(hrs * 60)
+
+        if remaining <= 0:
+            continue
+
+        if minutes_left == 0:
+            plan.append([])
+            minutes_left = day_minutes
+
+        # Fill whatever is left of the current day first
+        allocate = min(remaining, minutes_left)
+        plan[-1].append(prefix + format_time(allocate / 60))
+        minutes_left -= allocate
+        remaining -= allocate
+
+        if remaining <= 0:
+            continue
+
+        # The rest spans whole days plus one partial day
+        full, leftover = divmod(remaining, day_minutes)
+        for _ in range(full):
+            plan.append([prefix + format_time(daily_hours)])
+
+        if leftover > 0:
+            plan.append([prefix + format_time(leftover / 60)])
+            minutes_left = day_minutes - leftover
+        else:
+            minutes_left = 0
+
+    return plan
+
+# --------------------------------------------------------
+# Encode the plan as a plain-text download
+# --------------------------------------------------------
+def build_download(plan):
+    buf = io.StringIO()
+    buf.write("AI Study Plan\n\n")
+    for d, items in enumerate(plan, 1):
+        if not items:
+            continue
+        buf.write(f"\nDay {d}\n")
+        for item in items:
+            buf.write("- " + item + "\n")
+    return buf.getvalue().encode("utf-8")